@@ -1,73 +1,15 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import pickle
-from sklearn.metrics.pairwise import cosine_similarity
-import random
+import re
+from typing import NamedTuple
+from sklearn.preprocessing import normalize
 
 # =========================
-# Load Data and Models
-# =========================
-df = pickle.load(open("job_data.pkl", "rb"))
-vectorizer = pickle.load(open("tfidf_vectorizer.pkl", "rb"))
-
-# =========================
-# Data Cleanup
-# =========================
-if "id" in df.columns:
-    df.drop(columns=["id"], inplace=True)
-
-job_types = ["Permanent Full-time", "Part-time", "Work From Home", "On-site", "Contract"]
-if "job_type" not in df.columns:
-    df["job_type"] = [random.choice(job_types) for _ in range(len(df))]
-else:
-    df["job_type"] = df["job_type"].fillna(pd.Series([random.choice(job_types) for _ in range(len(df))]))
-
-df["avg_hourly_rate"] = df["avg_hourly_rate"].fillna(0)
-df["country"] = df["country"].fillna("Unknown")
-
+# Static HTML and CSS
 # =========================
-# Salary Formatting Function
-# =========================
-def format_salary(rate, country, experience_level):
-    """Format salary in INR or USD, adjusted by experience level."""
-    multiplier = 1.0
-    if experience_level == "Fresher":
-        multiplier = 0.8
-    elif experience_level == "Mid-Level":
-        multiplier = 1.2
-    elif experience_level == "Senior":
-        multiplier = 1.5
-
-    rate = rate * multiplier
-
-    if "india" in country.lower():
-        if rate >= 100000:
-            return f"₹{rate/100000:.1f} Lakh"
-        elif rate >= 1000:
-            return f"₹{rate/1000:.1f} Thousand"
-        else:
-            return f"₹{rate:.2f}/hr"
-    else:
-        if rate >= 100000:
-            return f"${rate/100000:.1f}K"
-        elif rate >= 1000:
-            return f"${rate/1000:.1f}K"
-        else:
-            return f"${rate:.2f}/hr"
-
-# =========================
-# Streamlit Page Config
-# =========================
-st.set_page_config(
-    page_title="Job Market Recommendation System",
-    page_icon="👩‍💻",
-    layout="wide"
-)
-
-# =========================
-# Custom CSS Styling
-# =========================
-st.markdown("""
+CSS = """
     <style>
         .stApp {
             background: linear-gradient(to bottom right, #fff8d6, #fff5b0);
@@ -104,7 +46,7 @@ st.markdown("""
             border: 2px solid #ffcc00;
             border-radius: 10px;
         }
-        .stButton>button {
+        .stButton>button, .stFormSubmitButton>button {
             background-color: #ffcc33;
             color: black;
             font-weight: bold;
@@ -112,96 +54,269 @@ st.markdown("""
             border: none;
             padding: 8px 20px;
         }
-        .stButton>button:hover {
+        .stButton>button:hover, .stFormSubmitButton>button:hover {
             background-color: #ffb700;
         }
         table td, table th {
             text-align: center !important;
         }
     </style>
-""", unsafe_allow_html=True)
+"""
+
+HEADERS = {
+    "title": '<h1 class="main-title"> 👩‍💻🏢👨‍💻 Job Market Analysis & Recommendation System</h1>',
+    "subtitle": "<p style='text-align:center; font-size:17px;'>Discover global job trends, compare real salaries, and find your perfect career fit!</p>",
+    "recommend": '<h2 class="section-header">🔍 Job Recommendation Engine</h2>',
+    "country": '<h2 class="section-header">🌎 Filter Jobs by Country</h2>',
+    "remote": '<h2 class="section-header">🏠 Remote Job Listings</h2>',
+    "skills": '<h2 class="section-header">🧠 Skill Gap Analyzer</h2>',
+    "resume": '<h2 class="section-header">📄 Resume Feedback Assistant</h2>',
+    "footer": "<center><b>🚀 Designed with ❤️ by Deepa Pathak | Internship Project</b></center>",
+}
+
+# =========================
+# Load Data and Models
+# =========================
+job_types = ["Permanent Full-time", "Part-time", "Work From Home", "On-site", "Contract"]
+
+class Assets(NamedTuple):
+    """Everything load_assets() precomputes, addressed by name rather than tuple position."""
+    df_display: pd.DataFrame
+    display_arrays: dict
+    vectorizer: object
+    tfidf_matrix: object
+    remote_mask: np.ndarray
+    india_mask: np.ndarray
+    unique_countries: tuple
+    country_rows_index: dict
+
+@st.cache_resource
+def load_assets():
+    """Load the job data and vectorizer once and precompute the corpus TF-IDF matrix, masks and country index."""
+    df = pickle.load(open("job_data.pkl", "rb"))
+    vectorizer = pickle.load(open("tfidf_vectorizer.pkl", "rb"))
+
+    # Data Cleanup
+    if "id" in df.columns:
+        df.drop(columns=["id"], inplace=True)
+
+    # Fixed seed keeps the imputed job types stable across reruns
+    rng = np.random.default_rng(0)
+    fill = rng.choice(job_types, size=len(df))
+    if "job_type" not in df.columns:
+        df["job_type"] = fill
+    else:
+        df["job_type"] = df["job_type"].fillna(pd.Series(fill, index=df.index))
+
+    df["avg_hourly_rate"] = df["avg_hourly_rate"].fillna(0)
+    df["country"] = df["country"].fillna("Unknown")
+    df["title"] = df["title"].astype(str)
+    df["country"] = df["country"].astype("category")
+    df["job_type"] = df["job_type"].astype("category")
+
+    titles_list = df["title"].tolist()
+    tfidf_matrix = vectorizer.transform(titles_list)
+    # L2-normalize the corpus once so each query is a single sparse dot product
+    tfidf_matrix = normalize(tfidf_matrix, norm="l2", copy=False)
+    # float32 CSR halves the bytes moved in every query's sparse product
+    tfidf_matrix = tfidf_matrix.astype(np.float32).tocsr()
+
+    # Remote-title mask, matched once with a precompiled pattern
+    remote_pattern = re.compile(r"remote", re.IGNORECASE)
+    remote_mask = np.fromiter((remote_pattern.search(t) is not None for t in titles_list), dtype=bool, count=len(titles_list))
+
+    # Projected display view shared by every results table
+    df_display = df[["title", "avg_hourly_rate", "country", "job_type"]].reset_index(drop=True)
+
+    # India test done once per category, then broadcast to rows via the codes
+    india_category = np.asarray(df["country"].cat.categories.str.contains("india", case=False))
+    india_mask = india_category[df["country"].cat.codes.to_numpy()]
+
+    # Per-column arrays so small top-k result sets can be gathered with ndarray.take
+    display_arrays = {col: df_display[col].to_numpy() for col in df_display.columns}
+
+    # Sorted countries for the selectbox and each country's row positions
+    unique_countries = tuple(df["country"].cat.categories)
+    country_rows_index = df.groupby("country", sort=False, observed=True).indices
+    return Assets(
+        df_display=df_display,
+        display_arrays=display_arrays,
+        vectorizer=vectorizer,
+        tfidf_matrix=tfidf_matrix,
+        remote_mask=remote_mask,
+        india_mask=india_mask,
+        unique_countries=unique_countries,
+        country_rows_index=country_rows_index,
+    )
+
+# =========================
+# Salary Formatting Function
+# =========================
+EXPERIENCE_MULTIPLIERS = {"Fresher": 0.8, "Mid-Level": 1.2, "Senior": 1.5}
+
+def format_salary(rate, country, experience_level):
+    """Format salary in INR or USD, adjusted by experience level."""
+    rate = rate * EXPERIENCE_MULTIPLIERS.get(experience_level, 1.0)
+
+    if "india" in country.lower():
+        if rate >= 100000:
+            return f"₹{rate/100000:.1f} Lakh"
+        elif rate >= 1000:
+            return f"₹{rate/1000:.1f} Thousand"
+        else:
+            return f"₹{rate:.2f}/hr"
+    else:
+        if rate >= 100000:
+            return f"${rate/100000:.1f}K"
+        elif rate >= 1000:
+            return f"${rate/1000:.1f}K"
+        else:
+            return f"${rate:.2f}/hr"
+
+MID_LEVEL_MULTIPLIER = EXPERIENCE_MULTIPLIERS["Mid-Level"]
+
+def format_salary_midlevel_vec(rates, is_india):
+    """Vectorized Mid-Level format_salary for the list views, given a precomputed India mask."""
+    adj = rates.to_numpy(dtype=float) * MID_LEVEL_MULTIPLIER
+
+    conditions = [adj >= 100000, adj >= 1000]
+    value = np.select(conditions, [adj / 100000, adj / 1000], default=adj)
+    number = np.where(adj >= 1000, np.char.mod("%.1f", value), np.char.mod("%.2f", value))
+    inr_suffix = np.select(conditions, [" Lakh", " Thousand"], default="/hr")
+    usd_suffix = np.select(conditions, ["K", "K"], default="/hr")
+
+    inr_str = np.char.add(np.char.add("₹", number), inr_suffix)
+    usd_str = np.char.add(np.char.add("$", number), usd_suffix)
+    return np.where(is_india, inr_str, usd_str)
+
+# =========================
+# Similarity Scoring
+# =========================
+def similarity_scores(query_vec, matrix):
+    """Score one L2-normalized query against the normalized CSR corpus as a single SpMV."""
+    # Multiplying the CSR corpus by the dense query column avoids converting
+    # the transposed corpus back to CSR on every call
+    return (matrix @ query_vec.toarray().T).ravel()
+
+@st.cache_data(max_entries=128)
+def query_scores(text):
+    """Similarity of a query string against every job title, memoized on the string."""
+    query_vec = normalize(assets.vectorizer.transform([text]), copy=False).astype(np.float32)
+    return similarity_scores(query_vec, assets.tfidf_matrix)
+
+# =========================
+# Top-k Retrieval
+# =========================
+def top_k_indices(similarity, k):
+    """Indices of the k highest scores, best first, via an O(N) partition instead of a full sort."""
+    k = min(k, len(similarity))
+    top_idx = np.argpartition(similarity, -k)[-k:]
+    return top_idx[np.argsort(-similarity[top_idx])]
+
+def top_matches(text, k):
+    """Row indices of the k jobs most similar to a query string, best first."""
+    return top_k_indices(query_scores(text), k)
+
+def take_rows(arrays, rows, columns):
+    """Build a result frame with a fresh RangeIndex by taking rows straight from the per-column arrays."""
+    return pd.DataFrame({col: arrays[col].take(rows) for col in columns}, index=pd.RangeIndex(len(rows)))
+
+# =========================
+# Streamlit Page Config
+# =========================
+st.set_page_config(
+    page_title="Job Market Recommendation System",
+    page_icon="👩‍💻",
+    layout="wide"
+)
+
+assets = load_assets()
+
+# =========================
+# Custom CSS Styling
+# =========================
+st.markdown(CSS, unsafe_allow_html=True)
 
 # =========================
 # App Title
 # =========================
-st.markdown('<h1 class="main-title"> 👩‍💻🏢👨‍💻 Job Market Analysis & Recommendation System</h1>', unsafe_allow_html=True)
-st.markdown("<p style='text-align:center; font-size:17px;'>Discover global job trends, compare real salaries, and find your perfect career fit!</p>", unsafe_allow_html=True)
+st.markdown(HEADERS["title"], unsafe_allow_html=True)
+st.markdown(HEADERS["subtitle"], unsafe_allow_html=True)
 
 # =========================
 # Job Recommendation Engine
 # =========================
-st.markdown('<h2 class="section-header">🔍 Job Recommendation Engine</h2>', unsafe_allow_html=True)
-job_input = st.text_input("Enter job title or skill:")
+st.markdown(HEADERS["recommend"], unsafe_allow_html=True)
+with st.form("rec_form"):
+    job_input = st.text_input("Enter job title or skill:")
+    st.form_submit_button("Recommend")
 
 if job_input:
-    tfidf_matrix = vectorizer.transform(df["title"].astype(str))
-    query_vec = vectorizer.transform([job_input])
-    similarity = cosine_similarity(query_vec, tfidf_matrix).flatten()
-    top_idx = similarity.argsort()[-5:][::-1]
-    results = df.iloc[top_idx][["title", "avg_hourly_rate", "country", "job_type"]]
-    results["Formatted Salary"] = results.apply(lambda x: format_salary(x["avg_hourly_rate"], x["country"], "Mid-Level"), axis=1)
+    top_idx = top_matches(job_input, 5)
+    results = take_rows(assets.display_arrays, top_idx, ["title", "avg_hourly_rate", "country", "job_type"])
+    results["Formatted Salary"] = format_salary_midlevel_vec(results["avg_hourly_rate"], assets.india_mask[top_idx])
 
     st.write("### 🏆 Top Recommended Jobs")
-    st.dataframe(results.reset_index(drop=True))
+    st.dataframe(results)
 else:
     st.info("Enter a job title or skill to get personalized job recommendations.")
 
 # =========================
 # Filter Jobs by Country
 # =========================
-st.markdown('<h2 class="section-header">🌎 Filter Jobs by Country</h2>', unsafe_allow_html=True)
-unique_countries = sorted(df["country"].dropna().unique())
-country_select = st.selectbox("Select Country", unique_countries)
+st.markdown(HEADERS["country"], unsafe_allow_html=True)
+country_select = st.selectbox("Select Country", assets.unique_countries)
 
-filtered_jobs = df[df["country"] == country_select][["title", "avg_hourly_rate", "country", "job_type"]]
+country_rows = assets.country_rows_index.get(country_select, np.empty(0, dtype=np.intp))
+filtered_jobs = take_rows(assets.display_arrays, country_rows, ["title", "avg_hourly_rate", "country", "job_type"])
 if not filtered_jobs.empty:
-    filtered_jobs["Formatted Salary"] = filtered_jobs.apply(lambda x: format_salary(x["avg_hourly_rate"], x["country"], "Mid-Level"), axis=1)
-    st.dataframe(filtered_jobs.reset_index(drop=True))
+    filtered_jobs["Formatted Salary"] = format_salary_midlevel_vec(filtered_jobs["avg_hourly_rate"], assets.india_mask[country_rows])
+    st.dataframe(filtered_jobs)
 else:
     st.warning("No jobs found for this country.")
 
 # =========================
 # Remote Jobs Section
 # =========================
-st.markdown('<h2 class="section-header">🏠 Remote Job Listings</h2>', unsafe_allow_html=True)
-remote_jobs = df[df["title"].str.contains("remote", case=False, na=False)][["title", "avg_hourly_rate", "country", "job_type"]]
+st.markdown(HEADERS["remote"], unsafe_allow_html=True)
+remote_rows = np.flatnonzero(assets.remote_mask)
+remote_jobs = take_rows(assets.display_arrays, remote_rows, ["title", "avg_hourly_rate", "country", "job_type"])
 if not remote_jobs.empty:
-    remote_jobs["Formatted Salary"] = remote_jobs.apply(lambda x: format_salary(x["avg_hourly_rate"], x["country"], "Mid-Level"), axis=1)
-    st.dataframe(remote_jobs.reset_index(drop=True))
+    remote_jobs["Formatted Salary"] = format_salary_midlevel_vec(remote_jobs["avg_hourly_rate"], assets.india_mask[remote_rows])
+    st.dataframe(remote_jobs)
 else:
     st.warning("No remote job listings found.")
 
 # =========================
 # Skill Gap Analyzer (Improved)
 # =========================
-st.markdown('<h2 class="section-header">🧠 Skill Gap Analyzer</h2>', unsafe_allow_html=True)
-skills_input = st.text_input("Enter your current skills (comma-separated):")
+st.markdown(HEADERS["skills"], unsafe_allow_html=True)
+with st.form("skills_form"):
+    skills_input = st.text_input("Enter your current skills (comma-separated):")
+    st.form_submit_button("Analyze Skills")
 
 if skills_input:
-    tfidf_matrix = vectorizer.transform(df["title"].astype(str))
-    query_vec = vectorizer.transform([skills_input])
-    similarity = cosine_similarity(query_vec, tfidf_matrix).flatten()
-    top_idx = similarity.argsort()[-3:][::-1]
-    matched_jobs = df.iloc[top_idx][["title", "job_type", "country"]]
+    top_idx = top_matches(skills_input, 3)
+    matched_jobs = take_rows(assets.display_arrays, top_idx, ["title", "job_type", "country"])
     st.success("Here are some roles that best match your skills:")
-    st.table(matched_jobs.reset_index(drop=True))
+    st.table(matched_jobs)
 else:
     st.info("Enter your skills (e.g., Python, Excel, Machine Learning) to analyze skill fit and missing gaps.")
 
 # =========================
 # Resume Feedback Section
 # =========================
-st.markdown('<h2 class="section-header">📄 Resume Feedback Assistant</h2>', unsafe_allow_html=True)
-experience_level = st.selectbox("Select Your Experience Level:", ["Fresher", "Mid-Level", "Senior"])
-resume_text = st.text_area("Paste your resume text here:")
+st.markdown(HEADERS["resume"], unsafe_allow_html=True)
+with st.form("resume_form"):
+    experience_level = st.selectbox("Select Your Experience Level:", ["Fresher", "Mid-Level", "Senior"])
+    resume_text = st.text_area("Paste your resume text here:")
+    analyze_resume = st.form_submit_button("Analyze Resume")
 
-if st.button("Analyze Resume"):
+if analyze_resume:
     if resume_text.strip():
-        tfidf_matrix = vectorizer.transform(df["title"].astype(str))
-        query_vec = vectorizer.transform([resume_text])
-        similarity = cosine_similarity(query_vec, tfidf_matrix).flatten()
+        similarity = query_scores(resume_text)
         best_match_idx = similarity.argmax()
-        best_job = df.iloc[best_match_idx]
+        best_job = assets.df_display.iloc[best_match_idx]
 
         salary_display = format_salary(best_job["avg_hourly_rate"], best_job["country"], experience_level)
         job_type = best_job["job_type"]
@@ -221,4 +336,4 @@ if st.button("Analyze Resume"):
 # Footer
 # =========================
 st.markdown("---")
-st.markdown("<center><b>🚀 Designed with ❤️ by Deepa Pathak | Internship Project</b></center>", unsafe_allow_html=True)
+st.markdown(HEADERS["footer"], unsafe_allow_html=True)